@@ -5,11 +5,11 @@ MongoDB helper functions ready to use in your backend code.
 Import and use these functions in your API endpoints for database operations.
 """
 
-from pymongo import MongoClient
+from motor.motor_asyncio import AsyncIOMotorClient
 from datetime import datetime, timezone
 import os
 from dotenv import load_dotenv
-from typing import Union
+from typing import List, Union
 from pydantic import BaseModel
 
 # Load environment variables from .env file
@@ -22,15 +22,31 @@ database_url = os.getenv("DATABASE_URL")
 database_name = os.getenv("DATABASE_NAME")
 
 if database_url and database_name:
-    _client = MongoClient(database_url)
+    _client = AsyncIOMotorClient(database_url)
     db = _client[database_name]
 
-# Helper functions for common database operations
-def create_document(collection_name: str, data: Union[BaseModel, dict]):
-    """Insert a single document with timestamp"""
-    if db is None:
-        raise Exception("Database not available. Check DATABASE_URL and DATABASE_NAME environment variables.")
+# Searchable fields per collection
+PRODUCT_SEARCH_FIELDS = ("title", "description", "category", "tags")
+SERVICE_SEARCH_FIELDS = PRODUCT_SEARCH_FIELDS + ("provider",)
+GIG_SEARCH_FIELDS = PRODUCT_SEARCH_FIELDS + ("company", "location")
+
+# Every searchable field is mirrored as a lowercase "<field>_lc" copy so prefix
+# searches can run against a plain index instead of a case-insensitive regex
+LOWERCASE_FIELDS = tuple(dict.fromkeys(PRODUCT_SEARCH_FIELDS + SERVICE_SEARCH_FIELDS + GIG_SEARCH_FIELDS))
 
+def add_lowercase_fields(data_dict: dict):
+    """Add lowercase shadow copies of the searchable fields"""
+    for field in LOWERCASE_FIELDS:
+        value = data_dict.get(field)
+        if isinstance(value, str):
+            data_dict[f"{field}_lc"] = value.lower()
+        elif isinstance(value, list):
+            data_dict[f"{field}_lc"] = [v.lower() for v in value if isinstance(v, str)]
+    return data_dict
+
+# Helper functions for common database operations
+def _to_document(data: Union[BaseModel, dict]):
+    """Build the stored dict for a model or dict, with timestamps and search fields"""
     # Convert Pydantic model to dict if needed
     if isinstance(data, BaseModel):
         data_dict = data.model_dump()
@@ -39,17 +55,35 @@ def create_document(collection_name: str, data: Union[BaseModel, dict]):
 
     data_dict['created_at'] = datetime.now(timezone.utc)
     data_dict['updated_at'] = datetime.now(timezone.utc)
+    add_lowercase_fields(data_dict)
+    return data_dict
 
-    result = db[collection_name].insert_one(data_dict)
+async def create_document(collection_name: str, data: Union[BaseModel, dict]):
+    """Insert a single document with timestamp"""
+    if db is None:
+        raise Exception("Database not available. Check DATABASE_URL and DATABASE_NAME environment variables.")
+
+    result = await db[collection_name].insert_one(_to_document(data))
     return str(result.inserted_id)
 
-def get_documents(collection_name: str, filter_dict: dict = None, limit: int = None):
+async def create_documents(collection_name: str, items: List[Union[BaseModel, dict]]):
+    """Insert several documents with timestamps in a single round trip"""
+    if db is None:
+        raise Exception("Database not available. Check DATABASE_URL and DATABASE_NAME environment variables.")
+
+    # unordered so the server keeps going past individual failures such as duplicate keys
+    result = await db[collection_name].insert_many([_to_document(item) for item in items], ordered=False)
+    return [str(inserted_id) for inserted_id in result.inserted_ids]
+
+async def get_documents(collection_name: str, filter_dict: dict = None, limit: int = None, sort: list = None, projection: dict = None):
     """Get documents from collection"""
     if db is None:
         raise Exception("Database not available. Check DATABASE_URL and DATABASE_NAME environment variables.")
     
-    cursor = db[collection_name].find(filter_dict or {})
+    cursor = db[collection_name].find(filter_dict or {}, projection)
+    if sort:
+        cursor = cursor.sort(sort)
     if limit:
         cursor = cursor.limit(limit)
-    
-    return list(cursor)
+
+    return await cursor.to_list(length=limit)
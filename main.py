@@ -1,32 +1,299 @@
 import os
-from fastapi import FastAPI, HTTPException
+import re
+import inspect
+import time
+import asyncio
+import hashlib
+import logging
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from functools import lru_cache
+import orjson
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, PlainTextResponse
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends import Backend
+from fastapi_cache.backends.redis import RedisBackend
+from fastapi_cache.coder import Coder
+from fastapi_cache.decorator import cache
+from redis import asyncio as aioredis
+from pydantic import BaseModel, TypeAdapter
 from typing import List, Optional
 
-from database import db, create_document, get_documents
+from database import (
+    db, create_documents, get_documents, LOWERCASE_FIELDS,
+    PRODUCT_SEARCH_FIELDS, SERVICE_SEARCH_FIELDS, GIG_SEARCH_FIELDS,
+)
 from schemas import Product, Service, Gig
 
-app = FastAPI(title="Marketplace API", version="1.1.0")
+logger = logging.getLogger(__name__)
+
+
+# Backoff between startup pings while MongoDB is unreachable (seconds)
+WARM_UP_RETRY_INITIAL = 1.0
+WARM_UP_RETRY_MAX = 30.0
+
+
+async def warm_up():
+    # wait for MongoDB, retrying with backoff, then build indexes; failures are
+    # logged, never fatal, and the indexes are built as soon as the database answers
+    if db is None:
+        return
+    delay = WARM_UP_RETRY_INITIAL
+    while True:
+        try:
+            await db.command("ping")
+            break
+        except Exception as e:
+            logger.warning("MongoDB ping failed at startup, retrying in %gs: %s", delay, e)
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, WARM_UP_RETRY_MAX)
+    await create_indexes()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    init_cache()
+    # runs in the background so an unreachable database delays neither startup nor
+    # /healthz, which reports 503 until MongoDB answers
+    warm_up_task = asyncio.create_task(warm_up())
+    yield
+    warm_up_task.cancel()
+
+app = FastAPI(title="Marketplace API", version="1.1.0", default_response_class=ORJSONResponse, lifespan=lifespan)
+
+# Explicit lists let Starlette precompute the CORS headers instead of echoing
+# the request's Origin/method/headers back on every call
+ALLOWED_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("ALLOWED_ORIGINS", "http://localhost:3000").split(",")
+    if origin.strip()
+]
+ALLOWED_METHODS = ["GET", "POST"]
+ALLOWED_HEADERS = ["content-type", "authorization"]
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=ALLOWED_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=ALLOWED_METHODS,
+    allow_headers=ALLOWED_HEADERS,
 )
+# Added after CORS so it wraps it: CORS headers land on the compressed response.
+# Listing pages are repetitive JSON and shrink well; tiny bodies are left alone.
+app.add_middleware(GZipMiddleware, minimum_size=500)
+
+# ----------------------------
+# Search indexes
+# ----------------------------
+
+# Searchable fields per collection (defined in database.py alongside the
+# lowercase shadow fields written for them)
+SEARCH_FIELDS = {
+    "product": PRODUCT_SEARCH_FIELDS,
+    "service": SERVICE_SEARCH_FIELDS,
+    "gig": GIG_SEARCH_FIELDS,
+}
+# "text" uses a weighted $text index; "prefix" does anchored, case-normalized
+# regex matches against the lowercase "<field>_lc" shadow fields
+SEARCH_MODE = os.getenv("SEARCH_MODE", "text").lower()
+# Compound indexes for the listing filters; each also serves its leading field alone
+FILTER_INDEXES = {
+    "product": [("category", 1), ("curated", 1)],
+    "service": [("category", 1), ("curated", 1)],
+    "gig": [("category", 1), ("remote", 1)],
+}
+# Relative weights; fields not listed default to 1
+TEXT_INDEX_WEIGHTS = {"title": 10, "tags": 5, "description": 2}
+TEXT_SCORE_SORT = [("score", {"$meta": "textScore"})]
+# Storage-only fields are dropped server-side rather than popped per document
+LIST_PROJECTION = {
+    "_id": 0,
+    "created_at": 0,
+    "updated_at": 0,
+    **{f"{field}_lc": 0 for field in LOWERCASE_FIELDS},
+}
+
+
+async def create_indexes():
+    if db is None:
+        return
+    # (collection, index keys, create_index options)
+    specs = [(name, keys, {}) for name, keys in FILTER_INDEXES.items()]
+    if SEARCH_MODE == "prefix":
+        specs.extend(
+            (name, f"{field}_lc", {})
+            for name, fields in SEARCH_FIELDS.items()
+            for field in fields
+        )
+    else:
+        specs.extend(
+            (name, [(field, "text") for field in fields], {"weights": TEXT_INDEX_WEIGHTS, "name": "search_text"})
+            for name, fields in SEARCH_FIELDS.items()
+        )
+    results = await asyncio.gather(
+        *(db[name].create_index(keys, **options) for name, keys, options in specs),
+        return_exceptions=True,
+    )
+    # e.g. an existing text index with other fields/weights (only one is allowed
+    # per collection); the app still serves, just without that index
+    for (name, keys, _), result in zip(specs, results):
+        if isinstance(result, Exception):
+            logger.warning("Could not create index %s on %s: %s", keys, name, result)
+
+# ----------------------------
+# Response cache
+# ----------------------------
+
+# Seconds a cached listing response stays valid
+LIST_CACHE_EXPIRE = 300
+
+
+class JSONBytesCoder(Coder):
+    """Stores rendered JSON bodies and replays them as-is on a cache hit"""
+
+    @classmethod
+    def encode(cls, value: Response) -> bytes:
+        return value.body
+
+    @classmethod
+    def decode(cls, value: bytes) -> Response:
+        return Response(content=value, media_type="application/json")
+
+
+# Upper bound on entries held by the per-process fallback cache
+LIST_CACHE_MAX_ENTRIES = 1024
+
+
+class BoundedInMemoryBackend(Backend):
+    """Per-process LRU cache with a hard entry cap, used when Redis is not configured"""
+
+    def __init__(self, max_entries: int):
+        self._store = OrderedDict()
+        self._max_entries = max_entries
+
+    def _get(self, key: str):
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+        if entry[1] <= time.monotonic():
+            del self._store[key]
+            return None
+        self._store.move_to_end(key)
+        return entry
+
+    async def get_with_ttl(self, key: str):
+        entry = self._get(key)
+        if entry is None:
+            return 0, None
+        return int(entry[1] - time.monotonic()), entry[0]
+
+    async def get(self, key: str):
+        entry = self._get(key)
+        return entry[0] if entry else None
+
+    async def set(self, key: str, value, expire: Optional[int] = None):
+        expires_at = time.monotonic() + expire if expire else float("inf")
+        self._store[key] = (value, expires_at)
+        self._store.move_to_end(key)
+        while len(self._store) > self._max_entries:
+            self._store.popitem(last=False)
+
+    async def clear(self, namespace: Optional[str] = None, key: Optional[str] = None):
+        if namespace:
+            keys = [k for k in self._store if k.startswith(namespace)]
+        elif key:
+            keys = [key] if key in self._store else []
+        else:
+            keys = []
+        for k in keys:
+            del self._store[k]
+        return len(keys)
+
+
+def list_cache_key(func, namespace: str = "", *, kwargs: dict, **_):
+    # key on what the query actually uses, so whitespace/case variants of q,
+    # over-long q and sub-minimum q share one entry with their normalized form
+    # (both search modes ignore case, so the term is lowercased here)
+    filters = sorted((name, value) for name, value in kwargs.items() if name != "q" and value is not None and value != "")
+    term = normalize_search(kwargs.get("q")).lower()
+    digest = hashlib.md5(repr((filters, term)).encode()).hexdigest()  # nosec: not used for security
+    return f"{FastAPICache.get_prefix()}:{namespace}:{digest}"
+
+
+def init_cache():
+    redis_url = os.getenv("REDIS_URL")
+    # fall back to a bounded per-process cache when Redis is not configured
+    if redis_url:
+        backend = RedisBackend(aioredis.from_url(redis_url))
+    else:
+        backend = BoundedInMemoryBackend(LIST_CACHE_MAX_ENTRIES)
+    FastAPICache.init(backend, prefix="mk", key_builder=list_cache_key)
+
+# Constant body, encoded once at import
+ROOT_BYTES = orjson.dumps({"message": "Marketplace Backend Running"})
 
 @app.get("/")
-def read_root():
-    return {"message": "Marketplace Backend Running"}
+async def read_root():
+    return Response(content=ROOT_BYTES, media_type="application/json")
 
 # ----------------------------
 # Health & Schema
 # ----------------------------
 
-@app.get("/test")
-def test_database():
+# /test reports configuration details, so it is only served when DEBUG is set
+DEBUG = os.getenv("DEBUG", "").lower() in ("1", "true", "yes")
+# How long a database ping result is reused by /healthz
+HEALTH_PING_TTL = 1.0
+# How long /healthz waits on a ping before reporting the database as down
+HEALTH_PING_TIMEOUT = 1.0
+
+_ping_checked_at = float("-inf")
+_ping_ok = False
+_ping_task = None
+
+
+async def database_ok():
+    global _ping_checked_at, _ping_ok, _ping_task
+    if db is None:
+        return False
+    now = time.monotonic()
+    if now - _ping_checked_at < HEALTH_PING_TTL:
+        return _ping_ok
+    # stamp before awaiting so probes arriving meanwhile reuse the last result
+    _ping_checked_at = now
+    # at most one ping in flight: a slow ping keeps running past the timeout and
+    # later probes wait on it again instead of starting another
+    if _ping_task is None or _ping_task.done():
+        _ping_task = asyncio.ensure_future(db.command("ping"))
+        _ping_task.add_done_callback(lambda task: task.cancelled() or task.exception())
+    try:
+        result = await asyncio.wait_for(asyncio.shield(_ping_task), HEALTH_PING_TIMEOUT)
+        _ping_ok = bool(result.get("ok"))
+    except Exception:
+        _ping_ok = False
+    return _ping_ok
+
+@app.get("/healthz", response_class=PlainTextResponse)
+async def healthz():
+    # cheap liveness/readiness probe: 200 "OK" while MongoDB answers pings
+    if await database_ok():
+        return PlainTextResponse("OK")
+    return PlainTextResponse("Database unavailable", status_code=503)
+
+@lru_cache(maxsize=1)
+def database_env_status():
+    # environment is fixed for the life of the process (database.py reads it at import)
+    return (
+        "✅ Set" if os.getenv("DATABASE_URL") else "❌ Not Set",
+        "✅ Set" if os.getenv("DATABASE_NAME") else "❌ Not Set",
+    )
+
+@app.get("/test", include_in_schema=DEBUG)
+async def test_database():
+    if not DEBUG:
+        raise HTTPException(status_code=404, detail="Not Found")
     response = {
         "backend": "✅ Running",
         "database": "❌ Not Available",
@@ -39,11 +306,10 @@ def test_database():
     try:
         if db is not None:
             response["database"] = "✅ Available"
-            response["database_url"] = "✅ Set" if os.getenv("DATABASE_URL") else "❌ Not Set"
-            response["database_name"] = "✅ Set" if os.getenv("DATABASE_NAME") else "❌ Not Set"
+            response["database_url"], response["database_name"] = database_env_status()
             response["connection_status"] = "Connected"
             try:
-                collections = db.list_collection_names()
+                collections = await db.list_collection_names()
                 response["collections"] = collections[:10]
                 response["database"] = "✅ Connected & Working"
             except Exception as e:
@@ -62,48 +328,55 @@ def test_database():
 class SeedRequest(BaseModel):
     force: bool = False
 
+# Example curated items, validated and dumped once at import
+PRODUCTS_SEED = [
+    Product(title="Minimalist Desk Lamp", description="Warm LED lamp with matte finish", price=59.0, category="Home", image="https://images.unsplash.com/photo-1507473885765-e6ed057f782c", tags=["lighting","desk"], curated=True).model_dump(),
+    Product(title="Ergonomic Chair", description="Breathable mesh back", price=199.0, category="Office", image="https://images.unsplash.com/photo-1503602642458-232111445657", tags=["chair","office"], curated=True).model_dump(),
+    Product(title="Stoneware Mug", description="Hand‑thrown, dishwasher safe", price=24.0, category="Kitchen", image="https://images.unsplash.com/photo-1514432324607-a09d9b4aefdd", tags=["mug","ceramic"], curated=True).model_dump(),
+]
+SERVICES_SEED = [
+    Service(title="Brand Design Sprint", description="1-week intensive brand refresh", price=1200, category="Design", provider="Top Studio", image="https://images.unsplash.com/photo-1526948128573-703ee1aeb6fa", tags=["branding","design"], curated=True).model_dump(),
+    Service(title="Landing Page Build", description="High-converting responsive page", price=800, category="Development", provider="Web Pro", image="https://images.unsplash.com/photo-1498050108023-c5249f4df085", tags=["web","react"], curated=True).model_dump(),
+    Service(title="Product Photography Pack", description="15 retouched shots", price=450, category="Photography", provider="Studio Light", image="https://images.unsplash.com/photo-1487412720507-e7ab37603c6f", tags=["photo","ecommerce"], curated=True).model_dump(),
+]
+GIGS_SEED = [
+    Gig(title="Event Photographer", description="4-hour evening shoot", pay=350, pay_type="fixed", category="Photography", company="Local Events", location="On-site", remote=False, tags=["photo","event"]).model_dump(),
+    Gig(title="Figma to React", description="Convert 5 screens", pay=45, pay_type="hourly", category="Development", company="Startup X", remote=True, tags=["react","frontend"]).model_dump(),
+    Gig(title="Shopify Setup Assistant", description="Configure theme and payments", pay=30, pay_type="hourly", category="Ecommerce", company="Indie Brand", remote=True, tags=["shopify","store"]).model_dump(),
+]
+
 @app.post("/seed")
-def seed_data(payload: SeedRequest):
+async def seed_data(payload: SeedRequest):
     # Only seed if collections are empty or force=True
+    # (metadata-based counts: only emptiness matters, so no collection scan is needed)
     collections = {
-        "product": db["product"].count_documents({}) if db else 0,
-        "service": db["service"].count_documents({}) if db else 0,
-        "gig": db["gig"].count_documents({}) if db else 0,
+        "product": await db["product"].estimated_document_count() if db is not None else 0,
+        "service": await db["service"].estimated_document_count() if db is not None else 0,
+        "gig": await db["gig"].estimated_document_count() if db is not None else 0,
     }
     if not payload.force and any(count > 0 for count in collections.values()):
         return {"status": "skipped", "reason": "Collections already contain data", "counts": collections}
 
-    # Example curated items
-    products = [
-        Product(title="Minimalist Desk Lamp", description="Warm LED lamp with matte finish", price=59.0, category="Home", image="https://images.unsplash.com/photo-1507473885765-e6ed057f782c", tags=["lighting","desk"], curated=True),
-        Product(title="Ergonomic Chair", description="Breathable mesh back", price=199.0, category="Office", image="https://images.unsplash.com/photo-1503602642458-232111445657", tags=["chair","office"], curated=True),
-        Product(title="Stoneware Mug", description="Hand‑thrown, dishwasher safe", price=24.0, category="Kitchen", image="https://images.unsplash.com/photo-1514432324607-a09d9b4aefdd", tags=["mug","ceramic"], curated=True),
-    ]
-    services = [
-        Service(title="Brand Design Sprint", description="1-week intensive brand refresh", price=1200, category="Design", provider="Top Studio", image="https://images.unsplash.com/photo-1526948128573-703ee1aeb6fa", tags=["branding","design"], curated=True),
-        Service(title="Landing Page Build", description="High-converting responsive page", price=800, category="Development", provider="Web Pro", image="https://images.unsplash.com/photo-1498050108023-c5249f4df085", tags=["web","react"], curated=True),
-        Service(title="Product Photography Pack", description="15 retouched shots", price=450, category="Photography", provider="Studio Light", image="https://images.unsplash.com/photo-1487412720507-e7ab37603c6f", tags=["photo","ecommerce"], curated=True),
-    ]
-    gigs = [
-        Gig(title="Event Photographer", description="4-hour evening shoot", pay=350, pay_type="fixed", category="Photography", company="Local Events", location="On-site", remote=False, tags=["photo","event"]),
-        Gig(title="Figma to React", description="Convert 5 screens", pay=45, pay_type="hourly", category="Development", company="Startup X", remote=True, tags=["react","frontend"]),
-        Gig(title="Shopify Setup Assistant", description="Configure theme and payments", pay=30, pay_type="hourly", category="Ecommerce", company="Indie Brand", remote=True, tags=["shopify","store"]),
-    ]
-
     inserted = {"products": 0, "services": 0, "gigs": 0}
     try:
-        for p in products:
-            create_document("product", p)
-            inserted["products"] += 1
-        for s in services:
-            create_document("service", s)
-            inserted["services"] += 1
-        for g in gigs:
-            create_document("gig", g)
-            inserted["gigs"] += 1
+        product_ids, service_ids, gig_ids = await asyncio.gather(
+            create_documents("product", PRODUCTS_SEED),
+            create_documents("service", SERVICES_SEED),
+            create_documents("gig", GIGS_SEED),
+        )
+        inserted["products"] = len(product_ids)
+        inserted["services"] = len(service_ids)
+        inserted["gigs"] = len(gig_ids)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Seeding failed: {str(e)}")
 
+    # the documents are written at this point; a cache failure must not read as a
+    # failed seed (a retry with force=True would insert everything twice)
+    try:
+        await asyncio.gather(*(FastAPICache.clear(namespace=name) for name in SEARCH_FIELDS))
+    except Exception as e:
+        logger.warning("Seeded, but clearing the listing cache failed: %s", e)
+
     return {"status": "ok", "inserted": inserted}
 
 # ----------------------------
@@ -111,82 +384,113 @@ def seed_data(payload: SeedRequest):
 # ----------------------------
 
 
-def build_search_query(base: dict, q: Optional[str]):
+def json_list_response(adapter: TypeAdapter, docs: list):
+    # returning a Response bypasses FastAPI's per-item response_model pass;
+    # response_model is kept on the routes for the OpenAPI schema
+    items = adapter.validate_python(docs, context={"from_db": True})
+    return Response(content=adapter.dump_json(items), media_type="application/json")
+
+
+# Shorter terms match nearly everything; longer ones are truncated
+MIN_SEARCH_LENGTH = 2
+MAX_SEARCH_LENGTH = 64
+
+
+def normalize_search(q: Optional[str]):
+    # the search term actually applied, or "" for no search
+    q = q.strip()[:MAX_SEARCH_LENGTH] if q else ""
+    return q if len(q) >= MIN_SEARCH_LENGTH else ""
+
+
+def build_search_query(base: dict, q: Optional[str], fields: tuple):
+    q = normalize_search(q)
     if q:
-        regex = {"$regex": q, "$options": "i"}
-        # add OR conditions common for most collections
-        base["$or"] = [
-            {"title": regex},
-            {"description": regex},
-            {"category": regex},
-            {"tags": regex},  # tags is an array; regex works on array elements in Mongo
-        ]
+        if SEARCH_MODE == "prefix":
+            # anchored and escaped so the B-tree index on each shadow field is usable
+            regex = {"$regex": "^" + re.escape(q.lower())}
+            base["$or"] = [{f"{field}_lc": regex} for field in fields]
+        else:
+            # served by the per-collection text index created at startup
+            base["$text"] = {"$search": q}
     return base
 
 
-@app.get("/products", response_model=List[Product])
-def list_products(category: Optional[str] = None, curated: Optional[bool] = None, q: Optional[str] = None):
-    query: dict = {}
-    if category:
-        query["category"] = category
-    if curated is not None:
-        query["curated"] = curated
-    query = build_search_query(query, q)
-    try:
-        docs = get_documents("product", query, limit=50)
-        for d in docs:
-            d.pop("_id", None)
-        return docs
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
-
-
-@app.get("/services", response_model=List[Service])
-def list_services(category: Optional[str] = None, curated: Optional[bool] = None, q: Optional[str] = None):
-    query: dict = {}
-    if category:
-        query["category"] = category
-    if curated is not None:
-        query["curated"] = curated
-    # also include provider/company fields in search using build then extend
-    query = build_search_query(query, q)
-    if q:
-        regex = {"$regex": q, "$options": "i"}
-        # ensure provider is considered as well
-        query.setdefault("$or", []).append({"provider": regex})
-    try:
-        docs = get_documents("service", query, limit=50)
-        for d in docs:
-            d.pop("_id", None)
-        return docs
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+def search_sort(query: dict):
+    # rank text matches by relevance, otherwise keep natural order
+    return TEXT_SCORE_SORT if "$text" in query else None
 
 
-@app.get("/gigs", response_model=List[Gig])
-def list_gigs(category: Optional[str] = None, remote: Optional[bool] = None, q: Optional[str] = None):
-    query: dict = {}
-    if category:
-        query["category"] = category
-    if remote is not None:
-        query["remote"] = remote
-    query = build_search_query(query, q)
-    if q:
-        regex = {"$regex": q, "$options": "i"}
-        query.setdefault("$or", []).extend([
-            {"company": regex},
-            {"location": regex},
-        ])
-    try:
-        docs = get_documents("gig", query, limit=50)
-        for d in docs:
-            d.pop("_id", None)
-        return docs
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+def make_list_handler(collection: str, model: type, search_fields: tuple, filters: dict):
+    """
+    Build the GET handler for a listing endpoint. `filters` maps each
+    optional query parameter to its type; each one given becomes an
+    equality filter on the field of the same name.
+    """
+    # validates and serializes a whole result page in one pydantic-core call each way
+    adapter = TypeAdapter(List[model])
+
+    async def handler(**params):
+        q = params.pop("q", None)
+        query: dict = {name: value for name, value in params.items() if value is not None and value != ""}
+        query = build_search_query(query, q, search_fields)
+        try:
+            docs = await get_documents(collection, query, limit=50, sort=search_sort(query), projection=LIST_PROJECTION)
+            return json_list_response(adapter, docs)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+
+    # FastAPI reads query parameters from the signature
+    handler.__name__ = f"list_{collection}s"
+    handler.__signature__ = inspect.Signature([
+        inspect.Parameter(name, inspect.Parameter.KEYWORD_ONLY, default=None, annotation=Optional[type_])
+        for name, type_ in {**filters, "q": str}.items()
+    ])
+    cached = cache(expire=LIST_CACHE_EXPIRE, coder=JSONBytesCoder, namespace=collection)(handler)
+
+    async def endpoint(**params):
+        # fastapi-cache2 puts Cache-Control/ETag on the injected response, which FastAPI
+        # discards when a Response is returned; carry them over to the one we send
+        response = params["response"]
+        result = await cached(**params)
+        if result is not response:
+            for header in ("cache-control", "etag"):
+                if header in response.headers:
+                    result.headers[header] = response.headers[header]
+        return result
+
+    endpoint.__name__ = handler.__name__
+    endpoint.__signature__ = inspect.signature(cached)
+    return endpoint
+
+
+app.add_api_route(
+    "/products",
+    make_list_handler("product", Product, PRODUCT_SEARCH_FIELDS, {"category": str, "curated": bool}),
+    response_model=List[Product],
+    methods=["GET"],
+)
+app.add_api_route(
+    "/services",
+    make_list_handler("service", Service, SERVICE_SEARCH_FIELDS, {"category": str, "curated": bool}),
+    response_model=List[Service],
+    methods=["GET"],
+)
+app.add_api_route(
+    "/gigs",
+    make_list_handler("gig", Gig, GIG_SEARCH_FIELDS, {"category": str, "remote": bool}),
+    response_model=List[Gig],
+    methods=["GET"],
+)
 
 
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("PORT", 8000))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    # one process per core; each worker has its own event loop and Mongo pool.
+    # Equivalent under Gunicorn:
+    #   gunicorn -k uvicorn.workers.UvicornWorker -w $(nproc) main:app --bind 0.0.0.0:$PORT
+    # Without Redis each worker has its own cache and /seed only clears the one that
+    # served it, so default to a single worker unless the cache is shared
+    default_workers = (os.cpu_count() or 1) if os.getenv("REDIS_URL") else 1
+    workers = int(os.getenv("WEB_CONCURRENCY", default_workers))
+    uvicorn.run("main:app", host="0.0.0.0", port=port, workers=workers, loop="uvloop", http="httptools")
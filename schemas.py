@@ -12,48 +12,70 @@ Model name is converted to lowercase for the collection name:
 - Gig -> "gig" collection
 """
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, TypeAdapter, ValidationInfo, field_validator
 from typing import Optional, List
 
 # ----------------------------
 # Core Marketplace Schemas
 # ----------------------------
 
+_http_url = TypeAdapter(HttpUrl)
+
+def check_image_url(value: Optional[str], info: ValidationInfo):
+    """
+    Validate image URLs on the way in. Documents read back from the
+    database (validation context {"from_db": True}) were checked when
+    written and are passed through untouched.
+    """
+    if value is not None and not (info.context or {}).get("from_db"):
+        _http_url.validate_python(value)
+    return value
+
 class Product(BaseModel):
     """
     Products collection schema
     Collection name: "product" (lowercase of class name)
     """
+    model_config = ConfigDict(extra='ignore', frozen=True, str_strip_whitespace=True)
+
     title: str = Field(..., description="Product title")
     description: Optional[str] = Field(None, description="Product description")
     price: float = Field(..., ge=0, description="Price in dollars")
     category: str = Field(..., description="Product category")
-    image: Optional[HttpUrl] = Field(None, description="Image URL")
+    image: Optional[str] = Field(None, description="Image URL")
     rating: Optional[float] = Field(4.5, ge=0, le=5, description="Average rating")
     curated: bool = Field(True, description="Whether item is curated")
     tags: Optional[List[str]] = Field(default_factory=list, description="Searchable tags")
     in_stock: bool = Field(True, description="Whether product is in stock")
 
+    _check_image = field_validator("image")(check_image_url)
+
 class Service(BaseModel):
     """
     Services collection schema
     Collection name: "service"
     """
+    model_config = ConfigDict(extra='ignore', frozen=True, str_strip_whitespace=True)
+
     title: str = Field(..., description="Service title")
     description: Optional[str] = Field(None, description="Service description")
     price: float = Field(..., ge=0, description="Base price")
     category: str = Field(..., description="Service category")
     provider: Optional[str] = Field(None, description="Provider name")
-    image: Optional[HttpUrl] = Field(None, description="Image URL")
+    image: Optional[str] = Field(None, description="Image URL")
     rating: Optional[float] = Field(4.6, ge=0, le=5)
     curated: bool = Field(True)
     tags: Optional[List[str]] = Field(default_factory=list)
 
+    _check_image = field_validator("image")(check_image_url)
+
 class Gig(BaseModel):
     """
     Gig jobs collection schema
     Collection name: "gig"
     """
+    model_config = ConfigDict(extra='ignore', frozen=True, str_strip_whitespace=True)
+
     title: str = Field(..., description="Gig title")
     description: Optional[str] = Field(None)
     pay: float = Field(..., ge=0, description="Hourly or fixed pay")
@@ -66,6 +88,8 @@ class Gig(BaseModel):
 
 # Optional: simple user to extend later
 class User(BaseModel):
+    model_config = ConfigDict(extra='ignore', frozen=True, str_strip_whitespace=True)
+
     name: str
     email: str
     is_active: bool = True